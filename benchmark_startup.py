@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Startup Benchmark for the Educational Video Summary Tool
+
+Measures how long the tool takes to start, and fails if it goes over
+budget:
+- Import time of video_summary_tool, from ``python -X importtime``, as a
+  multiple of the import time of the stdlib json module
+- Modules that must stay lazy (not imported until they are needed)
+- End-to-end wall-clock time of summarizing the 12-slide example lesson,
+  as a multiple of the time to start a bare interpreter
+
+Budgets are ratios against a stdlib baseline measured the same way, so
+they hold on fast and slow machines alike. All timings use a warm
+bytecode cache in a temporary directory.
+
+Usage:
+    python benchmark_startup.py [--runs N] [--launcher video_summary_tool.pyz]
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import statistics
+import subprocess
+from typing import Dict, List
+
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+MODULE = 'video_summary_tool'
+EXAMPLE_LESSON = os.path.join(HERE, 'example_lesson.json')
+
+# Budgets are set about 20% above the medians measured when they were
+# last set (CPython 3.11, Linux, 2026-10-19, warm bytecode): importing the
+# tool took 2.8x as long as importing json (about 24 ms vs 8.5 ms), and
+# summarizing the example lesson took 4.8x as long as starting a bare
+# interpreter (about 55 ms vs 11.5 ms). The import ratio ranged 2.4-3.1
+# between batches. Re-measure and lower the budgets when startup gets
+# faster, and only raise them with a reason in the commit message.
+
+# Cumulative import time of video_summary_tool / that of ``import json``
+IMPORT_TIME_BUDGET_RATIO = 3.5
+
+# Wall-clock time for the example lesson / that of ``python -c pass``
+END_TO_END_BUDGET_RATIO = 6.0
+
+# Reference module for the import-time ratio; the tool needs it anyway
+BASELINE_MODULE = 'json'
+
+# Modules only some code paths need; importing the tool must not load them
+LAZY_MODULES = (
+    'argparse',   # CLI only
+    'gzip',       # compressed streams only
+    'bz2',
+    'lzma',
+    'hashlib',    # course mode only
+    'heapq',
+    'shutil',
+    'tempfile',
+)
+
+
+def _python(pycache_dir: str) -> List[str]:
+    """
+    Interpreter command line with bytecode caching forced on in
+    ``pycache_dir``, so results don't depend on PYTHONDONTWRITEBYTECODE or
+    on whether the checkout already has a __pycache__.
+    """
+    return [sys.executable, '-X', f'pycache_prefix={pycache_dir}']
+
+
+def _environment() -> Dict[str, str]:
+    """Environment for benchmark subprocesses"""
+    env = dict(os.environ)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    return env
+
+
+def measure_import_time(runs: int = 9) -> Dict[str, float]:
+    """
+    Median cumulative import times in milliseconds of the tool and of the
+    baseline module, as reported by ``-X importtime`` in fresh interpreters
+    with warm bytecode, plus the median ratio of the two. Runs of the tool
+    and baseline are interleaved so machine load affects both alike.
+    """
+    tool_samples = []
+    baseline_samples = []
+    ratios = []
+    with tempfile.TemporaryDirectory() as pycache_dir:
+        def import_ms(module: str) -> float:
+            result = subprocess.run(
+                _python(pycache_dir) + ['-X', 'importtime', '-c', f'import {module}'],
+                cwd=HERE, env=_environment(), stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE, universal_newlines=True, check=True
+            )
+            return _cumulative_import_ms(result.stderr, module)
+        
+        # The first run writes the bytecode cache and isn't counted
+        import_ms(MODULE)
+        for _ in range(runs):
+            tool_ms = import_ms(MODULE)
+            baseline_ms = import_ms(BASELINE_MODULE)
+            tool_samples.append(tool_ms)
+            baseline_samples.append(baseline_ms)
+            ratios.append(tool_ms / baseline_ms)
+    return {
+        'tool': statistics.median(tool_samples),
+        'baseline': statistics.median(baseline_samples),
+        'ratio': statistics.median(ratios),
+    }
+
+
+def _cumulative_import_ms(importtime_output: str, module: str) -> float:
+    """Pick a module's cumulative time out of ``-X importtime`` output"""
+    for line in importtime_output.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        fields = line.split('|')
+        if len(fields) == 3 and fields[2].strip() == module:
+            return int(fields[1]) / 1000
+    raise RuntimeError(f"{module} not found in -X importtime output")
+
+
+def find_eager_lazy_modules() -> List[str]:
+    """Return the LAZY_MODULES that importing the tool loads anyway"""
+    script = (
+        f'import sys, json, {MODULE}; '
+        f'print(json.dumps([name for name in {list(LAZY_MODULES)!r} if name in sys.modules]))'
+    )
+    result = subprocess.run(
+        [sys.executable, '-c', script], cwd=HERE,
+        stdout=subprocess.PIPE, universal_newlines=True, check=True
+    )
+    return json.loads(result.stdout)
+
+
+def _median_wall_time(command: List[str], runs: int) -> float:
+    """Median wall-clock time of ``command`` in milliseconds, after a warm-up run"""
+    samples = []
+    for run in range(runs + 1):
+        start = time.perf_counter()
+        subprocess.run(command, cwd=HERE, env=_environment(),
+                       stdout=subprocess.DEVNULL, check=True)
+        if run:
+            samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def measure_end_to_end(runs: int = 10, launcher: str = '') -> Dict[str, float]:
+    """
+    Median wall-clock times for a bare interpreter and for summarizing the
+    example lesson, in milliseconds.
+    """
+    target = launcher or os.path.join(HERE, f'{MODULE}.py')
+    with tempfile.TemporaryDirectory() as temp_dir:
+        output_file = os.path.join(temp_dir, 'summary.md')
+        python = _python(temp_dir)
+        baseline = _median_wall_time(python + ['-c', 'pass'], runs)
+        total = _median_wall_time(
+            python + [target, '--input', EXAMPLE_LESSON, '--output', output_file], runs
+        )
+    return {'interpreter': baseline, 'total': total, 'ratio': total / baseline}
+
+
+def main():
+    """Run the startup benchmark and exit non-zero if a budget is exceeded"""
+    parser = argparse.ArgumentParser(
+        description="Measure startup time of the video summary tool against its budget"
+    )
+    parser.add_argument('--runs', type=int, default=10, help="Runs per measurement")
+    parser.add_argument('--launcher', default='',
+                        help="Benchmark this launcher (e.g. a .pyz) instead of the script")
+    args = parser.parse_args()
+    
+    failures = []
+    
+    imports = measure_import_time(args.runs)
+    print(f"Import time:        {imports['tool']:7.1f} ms")
+    print(f"Import {BASELINE_MODULE}:        {imports['baseline']:7.1f} ms")
+    print(f"Import ratio:       {imports['ratio']:7.2f}x (budget {IMPORT_TIME_BUDGET_RATIO:.2f}x)")
+    if imports['ratio'] > IMPORT_TIME_BUDGET_RATIO:
+        failures.append("import time over budget")
+    
+    eager = find_eager_lazy_modules()
+    print(f"Eager lazy modules: {', '.join(eager) or 'none'}")
+    if eager:
+        failures.append(f"imported eagerly: {', '.join(eager)}")
+    
+    timings = measure_end_to_end(args.runs, args.launcher)
+    print(f"Bare interpreter:   {timings['interpreter']:7.1f} ms")
+    print(f"Example lesson:     {timings['total']:7.1f} ms")
+    print(f"End-to-end ratio:   {timings['ratio']:7.2f}x (budget {END_TO_END_BUDGET_RATIO:.2f}x)")
+    if timings['ratio'] > END_TO_END_BUDGET_RATIO:
+        failures.append("end-to-end time over budget")
+    
+    if failures:
+        print("FAILED: " + "; ".join(failures))
+        sys.exit(1)
+    print("Startup within budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Single-file Launcher Builder for the Educational Video Summary Tool
+
+Packages video_summary_tool.py into an executable zipapp
+(video_summary_tool.pyz), a single file that is easy to copy around and
+run. The archive also contains bytecode compiled by the building
+interpreter, which other Python versions ignore in favour of the bundled
+source. Start-up time is about the same as running the script directly.
+
+Usage:
+    python build_zipapp.py [--output video_summary_tool.pyz]
+    ./video_summary_tool.pyz --input lesson.json --output summary.md
+"""
+
+import os
+import shutil
+import zipapp
+import argparse
+import tempfile
+import py_compile
+
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+MODULE = 'video_summary_tool'
+
+
+def build_zipapp(output_file: str, interpreter: str = '/usr/bin/env python3') -> str:
+    """
+    Build the launcher archive at ``output_file`` and return its path.
+    """
+    with tempfile.TemporaryDirectory() as staging:
+        source = os.path.join(staging, f'{MODULE}.py')
+        shutil.copyfile(os.path.join(HERE, f'{MODULE}.py'), source)
+        # zipimport finds a legacy .pyc next to the source; an unchecked hash
+        # pyc stays valid regardless of the timestamps stored in the zip
+        py_compile.compile(
+            source, cfile=os.path.join(staging, f'{MODULE}.pyc'), doraise=True,
+            invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH
+        )
+        zipapp.create_archive(
+            staging, output_file, interpreter=interpreter, main=f'{MODULE}:main'
+        )
+    return output_file
+
+
+def main():
+    """Command-line interface for building the launcher"""
+    parser = argparse.ArgumentParser(
+        description="Build a single-file zipapp launcher for the video summary tool"
+    )
+    parser.add_argument(
+        '--output', '-o',
+        default=os.path.join(HERE, f'{MODULE}.pyz'),
+        help="Path of the launcher to write"
+    )
+    parser.add_argument(
+        '--python', '-p',
+        default='/usr/bin/env python3',
+        help="Interpreter line for the launcher's shebang"
+    )
+    args = parser.parse_args()
+    
+    output_file = build_zipapp(args.output, args.python)
+    print(f"Launcher built: {output_file}")
+
+
+if __name__ == "__main__":
+    main()
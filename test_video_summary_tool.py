@@ -8,12 +8,23 @@ Run with: python3 test_video_summary_tool.py
 import unittest
 import json
 import os
+import io
+import sys
+import gzip
+import bz2
+import lzma
 import tempfile
+from unittest import mock
 from video_summary_tool import (
     VideoSummaryGenerator, 
+    CourseBookBuilder,
     SlideContent, 
     LessonSummary,
-    ContentType
+    ContentType,
+    parse_slide_ranges,
+    normalize_slide_number,
+    parse_content_types,
+    scan_lesson_text
 )
 
 
@@ -350,6 +361,521 @@ class TestVideoSummaryGenerator(unittest.TestCase):
         self.assertIn("### Empty", markdown)
 
 
+class TestCompressedStreams(unittest.TestCase):
+    """Test cases for compressed and stdin/stdout input and output"""
+    
+    LESSON_DATA = {
+        "lesson_title": "Stream Lesson",
+        "slides": [
+            {
+                "slide_number": 1,
+                "title": "Streams",
+                "content": [
+                    {"type": "text", "value": "Piped text"},
+                    {"type": "formula", "value": "y = mx + b"}
+                ]
+            }
+        ]
+    }
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.generator = VideoSummaryGenerator()
+        self.temp_dir = tempfile.mkdtemp()
+        self.payload = json.dumps(self.LESSON_DATA).encode('utf-8')
+    
+    def tearDown(self):
+        """Clean up temporary files"""
+        import shutil
+        if os.path.exists(self.temp_dir):
+            shutil.rmtree(self.temp_dir)
+    
+    def _write(self, name, data):
+        path = os.path.join(self.temp_dir, name)
+        with open(path, 'wb') as f:
+            f.write(data)
+        return path
+    
+    def test_load_compressed_by_extension(self):
+        """Test loading gzip, bz2 and xz inputs detected by extension"""
+        for name, compress in (("lesson.json.gz", gzip.compress),
+                               ("lesson.json.bz2", bz2.compress),
+                               ("lesson.json.xz", lzma.compress)):
+            path = self._write(name, compress(self.payload))
+            lesson = self.generator.load_lesson_data(path)
+            self.assertEqual(lesson.lesson_title, "Stream Lesson")
+            self.assertEqual(lesson.slides[0].formulae, ["y = mx + b"])
+    
+    def test_load_compressed_by_magic_bytes(self):
+        """Test loading compressed inputs without a telling extension"""
+        for name, compress in (("gz_lesson.json", gzip.compress),
+                               ("bz2_lesson.dat", bz2.compress),
+                               ("xz_lesson", lzma.compress)):
+            path = self._write(name, compress(self.payload))
+            lesson = self.generator.load_lesson_data(path)
+            self.assertEqual(lesson.lesson_title, "Stream Lesson")
+    
+    def test_compressed_output_by_extension(self):
+        """Test writing compressed summaries selected by extension"""
+        input_file = self._write("input.json", self.payload)
+        for name, module in (("out.md.gz", gzip),
+                             ("out.md.bz2", bz2),
+                             ("out.md.xz", lzma)):
+            output_file = os.path.join(self.temp_dir, name)
+            self.generator.process_lesson(input_file, output_file)
+            with module.open(output_file, 'rt', encoding='utf-8') as f:
+                content = f.read()
+            self.assertIn("# Stream Lesson", content)
+            self.assertIn("- Piped text", content)
+    
+    def test_stdin_to_stdout(self):
+        """Test '-' reads from stdin and writes to stdout"""
+        stdin = io.TextIOWrapper(io.BufferedReader(io.BytesIO(gzip.compress(self.payload))))
+        stdout = io.TextIOWrapper(io.BytesIO(), encoding='utf-8')
+        stderr = io.StringIO()
+        
+        with mock.patch.object(sys, 'stdin', stdin), \
+                mock.patch.object(sys, 'stdout', stdout), \
+                mock.patch.object(sys, 'stderr', stderr):
+            self.generator.process_lesson('-', '-')
+        
+        content = stdout.buffer.getvalue().decode('utf-8')
+        self.assertTrue(content.startswith("# Stream Lesson"))
+        self.assertIn("y = mx + b", content)
+        # Status messages must not pollute the piped summary
+        self.assertNotIn("Summary generated", content)
+        self.assertIn("Summary generated", stderr.getvalue())
+        self.assertFalse(stdin.closed)
+        self.assertFalse(stdout.closed)
+
+
+class TestCourseBookBuilder(unittest.TestCase):
+    """Test cases for the CourseBookBuilder class"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.temp_dir, "cache")
+        self.output_file = os.path.join(self.temp_dir, "book.md")
+        self.builder = CourseBookBuilder(cache_dir=self.cache_dir)
+    
+    def tearDown(self):
+        """Clean up temporary files"""
+        import shutil
+        if os.path.exists(self.temp_dir):
+            shutil.rmtree(self.temp_dir)
+    
+    def _write_lesson(self, name, title, content):
+        lesson_data = {
+            "lesson_title": title,
+            "slides": [
+                {"slide_number": 1, "title": f"{title} Slide", "content": content}
+            ]
+        }
+        with open(os.path.join(self.temp_dir, name), 'w') as f:
+            json.dump(lesson_data, f)
+    
+    def _write_manifest(self, lessons):
+        manifest_file = os.path.join(self.temp_dir, "course.json")
+        with open(manifest_file, 'w') as f:
+            json.dump({"course_title": "Test Course", "lessons": lessons}, f)
+        return manifest_file
+    
+    def _write_course(self):
+        self._write_lesson("one.json", "Limits", [
+            {"type": "text", "value": "Limits text"},
+            {"type": "key_term", "term": "Limit", "definition": "Approached value"},
+            {"type": "formula", "value": "lim f(x)"}
+        ])
+        self._write_lesson("two.json", "Derivatives", [
+            {"type": "key_term", "term": "Derivative", "definition": "Rate of change"},
+            {"type": "key_term", "term": "limit", "definition": "Approached value"},
+            {"type": "equation", "value": "lim f(x)"}
+        ])
+        return self._write_manifest(["one.json", "two.json"])
+    
+    def _read_book(self):
+        with open(self.output_file, 'r', encoding='utf-8') as f:
+            return f.read()
+    
+    def test_build_book(self):
+        """Test lessons are concatenated in manifest order with anchors"""
+        manifest_file = self._write_course()
+        
+        stats = self.builder.build(manifest_file, self.output_file)
+        book = self._read_book()
+        
+        self.assertEqual(stats, {'lessons': 2, 'reused': 0})
+        self.assertTrue(book.startswith("# Test Course"))
+        self.assertIn("1. [Limits](#lesson-1)", book)
+        self.assertIn('<a id="lesson-2"></a>\n## 2. Derivatives', book)
+        self.assertIn("### Limits Slide", book)
+        self.assertIn("- Limits text", book)
+        self.assertLess(book.index("## 1. Limits"), book.index("## 2. Derivatives"))
+    
+    def test_merged_glossary_and_formula_index(self):
+        """Test key terms and formulae are merged across lessons"""
+        manifest_file = self._write_course()
+        
+        self.builder.build(manifest_file, self.output_file)
+        book = self._read_book()
+        
+        glossary = book[book.index("## Glossary"):book.index("## Formula Index")]
+        self.assertLess(glossary.index("**Derivative**"), glossary.index("**Limit**"))
+        self.assertEqual(glossary.count("imit**"), 1)
+        self.assertIn("[Lesson 1](#lesson-1), slide 1; [Lesson 2](#lesson-2), slide 1", glossary)
+        
+        formula_index = book[book.index("## Formula Index"):]
+        self.assertEqual(formula_index.count("`lim f(x)`"), 1)
+    
+    def test_unchanged_lessons_reused(self):
+        """Test unchanged lessons are reused and stale fragments pruned"""
+        manifest_file = self._write_course()
+        self.builder.build(manifest_file, self.output_file)
+        first_book = self._read_book()
+        
+        stats = self.builder.build(manifest_file, self.output_file)
+        self.assertEqual(stats, {'lessons': 2, 'reused': 2})
+        self.assertEqual(self._read_book(), first_book)
+        
+        self._write_lesson("two.json", "Integrals", [
+            {"type": "text", "value": "Area under a curve"}
+        ])
+        stats = self.builder.build(manifest_file, self.output_file)
+        self.assertEqual(stats, {'lessons': 2, 'reused': 1})
+        self.assertIn("## 2. Integrals", self._read_book())
+        self.assertNotIn("Derivative", self._read_book())
+        # An explicit cache dir may be shared, so it isn't pruned by default
+        self.assertEqual(len(os.listdir(self.cache_dir)), 12)
+        
+        pruning_builder = CourseBookBuilder(cache_dir=self.cache_dir, prune_cache=True)
+        stats = pruning_builder.build(manifest_file, self.output_file)
+        self.assertEqual(stats, {'lessons': 2, 'reused': 2})
+        self.assertEqual(len(os.listdir(self.cache_dir)), 8)
+    
+    def test_default_cache_pruned(self):
+        """Test the default <output>.cache directory is pruned after builds"""
+        manifest_file = self._write_course()
+        builder = CourseBookBuilder()
+        builder.build(manifest_file, self.output_file)
+        
+        self._write_lesson("two.json", "Integrals", [])
+        builder.build(manifest_file, self.output_file)
+        
+        self.assertEqual(len(os.listdir(self.output_file + ".cache")), 8)
+    
+    def test_non_fragment_files_survive(self):
+        """Test pruning only removes fragment files of other lessons"""
+        os.makedirs(self.cache_dir)
+        for name in ("notes.body.md", "config.meta.json", "a" * 63 + ".terms.jsonl"):
+            with open(os.path.join(self.cache_dir, name), 'w') as f:
+                f.write("keep me")
+        
+        manifest_file = self._write_course()
+        CourseBookBuilder(cache_dir=self.cache_dir, prune_cache=True).build(
+            manifest_file, self.output_file)
+        
+        for name in ("notes.body.md", "config.meta.json", "a" * 63 + ".terms.jsonl"):
+            self.assertTrue(os.path.exists(os.path.join(self.cache_dir, name)))
+    
+    def test_shared_cache_reused_across_courses(self):
+        """Test two courses sharing a cache dir don't evict each other"""
+        manifest_a = self._write_course()
+        self._write_lesson("three.json", "Series", [{"type": "text", "value": "Sums"}])
+        manifest_b = os.path.join(self.temp_dir, "course_b.json")
+        with open(manifest_b, 'w') as f:
+            json.dump({"course_title": "Course B", "lessons": ["three.json"]}, f)
+        
+        self.builder.build(manifest_a, self.output_file)
+        self.builder.build(manifest_b, os.path.join(self.temp_dir, "book_b.md"))
+        stats = self.builder.build(manifest_a, self.output_file)
+        
+        self.assertEqual(stats, {'lessons': 2, 'reused': 2})
+    
+    def test_build_to_stdout_stats(self):
+        """Test build() returns only the counts when writing to stdout"""
+        manifest_file = self._write_course()
+        stdout = io.TextIOWrapper(io.BytesIO(), encoding='utf-8')
+        
+        with mock.patch.object(sys, 'stdout', stdout):
+            stats = CourseBookBuilder().build(manifest_file, '-')
+        
+        self.assertEqual(stats, {'lessons': 2, 'reused': 0})
+        self.assertIn("# Test Course", stdout.buffer.getvalue().decode('utf-8'))
+    
+    def test_differing_definitions_kept(self):
+        """Test every distinct definition of a term appears in the glossary"""
+        self._write_lesson("one.json", "Sequences", [
+            {"type": "key_term", "term": "Limit", "definition": "A bound on a sequence"}
+        ])
+        self._write_lesson("two.json", "Functions", [
+            {"type": "key_term", "term": "limit", "definition": "Approached value"}
+        ])
+        manifest_file = self._write_manifest(["one.json", "two.json"])
+        
+        self.builder.build(manifest_file, self.output_file)
+        glossary = self._read_book().split("## Glossary\n")[1]
+        
+        self.assertIn("**Limit**:\n", glossary)
+        self.assertIn("- A bound on a sequence ([Lesson 1](#lesson-1), slide 1)", glossary)
+        self.assertIn("- Approached value ([Lesson 2](#lesson-2), slide 1)", glossary)
+    
+    def test_non_numeric_slide_references(self):
+        """Test references tolerate string and missing slide numbers"""
+        lesson_data = {
+            "lesson_title": "Odd Numbers",
+            "slides": [
+                {"slide_number": "10", "content": [{"type": "formula", "value": "a = b"}]},
+                {"slide_number": "intro", "content": [{"type": "formula", "value": "a = b"}]},
+                {"slide_number": None, "content": [{"type": "formula", "value": "a = b"}]},
+                {"content": [{"type": "formula", "value": "a = b"}]},
+                {"slide_number": 2, "content": [{"type": "formula", "value": "a = b"}]}
+            ]
+        }
+        with open(os.path.join(self.temp_dir, "odd.json"), 'w') as f:
+            json.dump(lesson_data, f)
+        manifest_file = self._write_manifest(["odd.json"])
+        
+        self.builder.build(manifest_file, self.output_file)
+        
+        self.assertIn("- `a = b` ([Lesson 1](#lesson-1), slides 2, 10, intro)", self._read_book())
+    
+    def test_missing_slide_number_left_out_of_references(self):
+        """Test a slide without a number isn't cited as slide 0"""
+        with open(os.path.join(self.temp_dir, "one.json"), 'w') as f:
+            json.dump({"lesson_title": "Unnumbered", "slides": [
+                {"content": [{"type": "key_term", "term": "Limit", "definition": "Bound"}]}
+            ]}, f)
+        manifest_file = self._write_manifest(["one.json"])
+        
+        self.builder.build(manifest_file, self.output_file)
+        
+        self.assertIn("**Limit**: Bound ([Lesson 1](#lesson-1))\n", self._read_book())
+    
+    def test_repeated_lesson_not_counted_as_reused(self):
+        """Test only fragments from a previous build count as reused"""
+        self._write_course()
+        manifest_file = self._write_manifest(["one.json", "one.json", "two.json"])
+        
+        stats = self.builder.build(manifest_file, self.output_file)
+        self.assertEqual(stats, {'lessons': 3, 'reused': 0})
+        
+        stats = self.builder.build(manifest_file, self.output_file)
+        self.assertEqual(stats, {'lessons': 3, 'reused': 3})
+    
+    def test_tool_change_invalidates_cache(self):
+        """Test fragments from a different version of the tool are not reused"""
+        manifest_file = self._write_course()
+        self.builder.build(manifest_file, self.output_file)
+        
+        changed_tool = CourseBookBuilder(cache_dir=self.cache_dir)
+        changed_tool._tool_source_digest = "0" * 64
+        stats = changed_tool.build(manifest_file, self.output_file)
+        
+        self.assertEqual(stats, {'lessons': 2, 'reused': 0})
+    
+    def test_cache_options_rejected_without_course(self):
+        """Test --cache-dir and --prune-cache are refused in single-lesson mode"""
+        from video_summary_tool import main
+        
+        argv = ["video_summary_tool.py", "-i", "lesson.json", "-o", self.output_file,
+                "--cache-dir", self.cache_dir]
+        with mock.patch.object(sys, 'argv', argv), \
+                mock.patch.object(sys, 'stderr', io.StringIO()) as stderr:
+            with self.assertRaises(SystemExit) as context:
+                main()
+        
+        self.assertEqual(context.exception.code, 2)
+        self.assertIn("--cache-dir and --prune-cache", stderr.getvalue())
+
+
+class TestSlideSelection(unittest.TestCase):
+    """Test cases for slide range and content type extracts"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.generator = VideoSummaryGenerator()
+        self.temp_dir = tempfile.mkdtemp()
+        lesson_data = {
+            "lesson_title": "Selection Lesson",
+            "slides": [
+                {
+                    "slide_number": i,
+                    "title": f"Slide {i}",
+                    "content": [
+                        {"type": "text", "value": f"Content {i}"},
+                        {"type": "formula", "value": f"x = {i}"} if i % 2 else
+                        {"type": "table", "headers": ["N"], "rows": [[str(i)]]}
+                    ]
+                }
+                for i in range(1, 81)
+            ]
+        }
+        self.test_file = os.path.join(self.temp_dir, "selection_lesson.json")
+        with open(self.test_file, 'w') as f:
+            json.dump(lesson_data, f, indent=2)
+    
+    def tearDown(self):
+        """Clean up temporary files"""
+        import shutil
+        if os.path.exists(self.temp_dir):
+            shutil.rmtree(self.temp_dir)
+    
+    def test_parse_slide_ranges(self):
+        """Test parsing of slide range specifications"""
+        self.assertEqual(parse_slide_ranges("40-60"), [(40, 60)])
+        self.assertEqual(parse_slide_ranges("3, 7-9"), [(3, 3), (7, 9)])
+        self.assertEqual(parse_slide_ranges("50-")[0][0], 50)
+        self.assertEqual(parse_slide_ranges("-5")[0][1], 5)
+        for spec in ("", "a-b", "9-3"):
+            with self.assertRaises(ValueError):
+                parse_slide_ranges(spec)
+    
+    def test_parse_content_types(self):
+        """Test parsing of content type filters"""
+        self.assertEqual(parse_content_types("Formula, table"), {"formula", "table"})
+        with self.assertRaises(ValueError):
+            parse_content_types("formulas")
+    
+    def test_scan_lesson_text(self):
+        """Test the offset scan finds slides without being fooled by strings"""
+        text = json.dumps({
+            "slides": [
+                {"content": [{"type": "text", "value": "\"slide_number\": 9, ]}"}],
+                 "slide_number": 4}
+            ],
+            "meta": {"lesson_title": "Nested"},
+            "lesson_title": "Scanned"
+        })
+        
+        lesson_title, slides = scan_lesson_text(text)
+        
+        self.assertEqual(lesson_title, "Scanned")
+        self.assertEqual(slides, [(4, json.loads(text)["slides"][0])])
+        
+        _, slides = scan_lesson_text(text, keep=lambda number: number != 4)
+        self.assertEqual(slides, [])
+    
+    def test_load_slide_range(self):
+        """Test only slides in the selected range are loaded"""
+        lesson = self.generator.load_lesson_data(
+            self.test_file, slide_ranges=parse_slide_ranges("40-60,75-"))
+        
+        numbers = [slide.slide_number for slide in lesson.slides]
+        self.assertEqual(numbers, list(range(40, 61)) + list(range(75, 81)))
+        self.assertEqual(lesson.lesson_title, "Selection Lesson")
+        self.assertEqual(lesson.slides[0].text, ["Content 40"])
+    
+    def test_normalize_slide_number(self):
+        """Test slide numbers are normalized to ints where possible"""
+        self.assertEqual(normalize_slide_number(7), 7)
+        self.assertEqual(normalize_slide_number(" 2 "), 2)
+        self.assertEqual(normalize_slide_number(3.0), 3)
+        for value in (None, "intro", 2.5, True, [1]):
+            self.assertIsNone(normalize_slide_number(value))
+    
+    def test_load_slide_range_string_numbers(self):
+        """Test string and missing slide numbers don't break range selection"""
+        lesson_data = {
+            "lesson_title": "String Numbers",
+            "slides": [
+                {"slide_number": "2", "title": "Two", "content": []},
+                {"slide_number": "intro", "title": "Intro", "content": []},
+                {"slide_number": None, "title": "Null", "content": []},
+                {"title": "Missing", "content": []},
+                {"slide_number": 5, "title": "Five", "content": []}
+            ]
+        }
+        test_file = os.path.join(self.temp_dir, "string_numbers.json")
+        with open(test_file, 'w') as f:
+            json.dump(lesson_data, f)
+        
+        lesson = self.generator.load_lesson_data(
+            test_file, slide_ranges=parse_slide_ranges("1-3"))
+        self.assertEqual([slide.title for slide in lesson.slides], ["Two"])
+        
+        # A missing number must not be treated as slide 0
+        for spec in ("-5", "0"):
+            lesson = self.generator.load_lesson_data(
+                test_file, slide_ranges=parse_slide_ranges(spec))
+            self.assertNotIn("Missing", [slide.title for slide in lesson.slides])
+    
+    def test_null_lesson_title_same_with_and_without_filters(self):
+        """Test a null lesson title gets the same fallback on both load paths"""
+        test_file = os.path.join(self.temp_dir, "null_title.json")
+        with open(test_file, 'w') as f:
+            json.dump({"lesson_title": None, "slides": [{"slide_number": 1}]}, f)
+        
+        unfiltered = self.generator.load_lesson_data(test_file)
+        filtered = self.generator.load_lesson_data(
+            test_file, slide_ranges=parse_slide_ranges("1"))
+        
+        self.assertEqual(unfiltered.lesson_title, "Untitled Lesson")
+        self.assertEqual(filtered.lesson_title, "Untitled Lesson")
+    
+    def test_load_content_types(self):
+        """Test type filters keep only matching content and non-empty slides"""
+        lesson = self.generator.load_lesson_data(
+            self.test_file, slide_ranges=parse_slide_ranges("1-10"),
+            content_types={"formula"})
+        
+        self.assertEqual([slide.slide_number for slide in lesson.slides], [1, 3, 5, 7, 9])
+        for slide in lesson.slides:
+            self.assertEqual(slide.text, [])
+            self.assertEqual(len(slide.formulae), 1)
+    
+    def test_tables_only_extract(self):
+        """Test a tables-only extract renders no other content"""
+        output_file = os.path.join(self.temp_dir, "tables.md")
+        self.generator.process_lesson(self.test_file, output_file,
+                                      content_types=parse_content_types("table"))
+        
+        with open(output_file, 'r') as f:
+            content = f.read()
+        self.assertIn("### Slide 80", content)
+        self.assertNotIn("### Slide 79", content)
+        self.assertNotIn("Content", content)
+        self.assertEqual(content.count("#### Tables"), 40)
+
+
+class TestStartupBudget(unittest.TestCase):
+    """Test cases keeping CLI startup within its import-time budget"""
+    
+    def test_lazy_modules_not_imported(self):
+        """Test optional subsystems are not imported with the tool"""
+        from benchmark_startup import find_eager_lazy_modules
+        
+        self.assertEqual(find_eager_lazy_modules(), [])
+    
+    def test_import_time_budget(self):
+        """Test importing the tool stays within its budget relative to json"""
+        from benchmark_startup import measure_import_time, IMPORT_TIME_BUDGET_RATIO
+        
+        imports = measure_import_time()
+        self.assertLessEqual(imports['ratio'], IMPORT_TIME_BUDGET_RATIO,
+                             f"import took {imports['tool']:.1f} ms, "
+                             f"{imports['ratio']:.2f}x json's {imports['baseline']:.1f} ms")
+    
+    def test_zipapp_launcher(self):
+        """Test the single-file launcher summarizes a lesson"""
+        import subprocess
+        from build_zipapp import build_zipapp
+        
+        temp_dir = tempfile.mkdtemp()
+        try:
+            launcher = build_zipapp(os.path.join(temp_dir, "tool.pyz"))
+            input_file = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                      "example_lesson.json")
+            result = subprocess.run(
+                [sys.executable, launcher, "--input", input_file, "--output", "-"],
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True
+            )
+            self.assertTrue(result.stdout.decode('utf-8').startswith("# Introduction to Calculus"))
+        finally:
+            import shutil
+            shutil.rmtree(temp_dir)
+
+
 class TestSlideContent(unittest.TestCase):
     """Test cases for the SlideContent class"""
     
@@ -412,6 +938,10 @@ def run_tests():
     
     # Add test classes
     suite.addTests(loader.loadTestsFromTestCase(TestVideoSummaryGenerator))
+    suite.addTests(loader.loadTestsFromTestCase(TestCompressedStreams))
+    suite.addTests(loader.loadTestsFromTestCase(TestCourseBookBuilder))
+    suite.addTests(loader.loadTestsFromTestCase(TestSlideSelection))
+    suite.addTests(loader.loadTestsFromTestCase(TestStartupBudget))
     suite.addTests(loader.loadTestsFromTestCase(TestSlideContent))
     suite.addTests(loader.loadTestsFromTestCase(TestLessonSummary))
     
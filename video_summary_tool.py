@@ -12,15 +12,147 @@ a structured summary with headings, lists, and explicit inclusion of:
 
 Usage:
     python video_summary_tool.py --input <input_file> --output <output_file>
+
+    python video_summary_tool.py --course <manifest_file> --output <book_file>
+
+Input and output paths ending in .gz, .bz2 or .xz are transparently
+(de)compressed, and "-" reads from stdin / writes to stdout.
 """
 
+import io
+import os
+import re
+import sys
 import json
-import argparse
-from typing import List, Dict, Any
+import itertools
+from contextlib import contextmanager
+from typing import List, Dict, Any, Callable, IO, Iterator, Optional, Set, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 
 
+# Buffer size used for file, pipe and codec reads/writes
+IO_BUFFER_SIZE = 1024 * 1024
+
+# Path used on the command line to mean stdin/stdout
+STDIO_PATH = '-'
+
+# Part of every course cache key, together with a digest of this file's
+# source (see CourseBookBuilder._tool_digest). Editing the tool already
+# invalidates cached fragments; bump this as well whenever the fragment
+# files or the rendered output change, so the reason is recorded
+COURSE_CACHE_VERSION = 2
+
+# Compression codecs recognised by file extension
+COMPRESSION_EXTENSIONS = {
+    '.gz': 'gzip',
+    '.bz2': 'bz2',
+    '.xz': 'xz',
+}
+
+# Compression codecs recognised by leading magic bytes
+COMPRESSION_MAGIC = (
+    (b'\x1f\x8b', 'gzip'),
+    (b'BZh', 'bz2'),
+    (b'\xfd7zXZ\x00', 'xz'),
+)
+
+
+def _codec_from_extension(path: str) -> Optional[str]:
+    """Return the compression codec implied by a path's extension, if any"""
+    for extension, codec in COMPRESSION_EXTENSIONS.items():
+        if path.lower().endswith(extension):
+            return codec
+    return None
+
+
+def _codec_from_magic(header: bytes) -> Optional[str]:
+    """Return the compression codec implied by a stream's magic bytes, if any"""
+    for magic, codec in COMPRESSION_MAGIC:
+        if header.startswith(magic):
+            return codec
+    return None
+
+
+def _wrap_codec(raw: IO[bytes], codec: Optional[str], mode: str) -> IO[bytes]:
+    """Wrap a binary stream in the decompressor/compressor for ``codec``"""
+    if codec == 'gzip':
+        import gzip
+        return gzip.GzipFile(fileobj=raw, mode=mode)
+    if codec == 'bz2':
+        import bz2
+        return bz2.BZ2File(raw, mode=mode)
+    if codec == 'xz':
+        import lzma
+        return lzma.LZMAFile(raw, mode=mode)
+    return raw
+
+
+@contextmanager
+def open_input_stream(path: str) -> Iterator[IO[str]]:
+    """
+    Open a lesson input for reading as UTF-8 text.
+
+    ``path`` may be "-" for stdin. Compressed inputs are detected by
+    extension or, failing that, by magic bytes, and decompressed on the fly.
+    """
+    if path == STDIO_PATH:
+        raw = sys.stdin.buffer
+    else:
+        raw = open(path, 'rb', buffering=IO_BUFFER_SIZE)
+    
+    try:
+        codec = _codec_from_extension(path) or _codec_from_magic(raw.peek(8))
+        binary = _wrap_codec(raw, codec, 'rb')
+        if binary is not raw:
+            binary = io.BufferedReader(binary, IO_BUFFER_SIZE)
+        text = io.TextIOWrapper(binary, encoding='utf-8')
+        try:
+            yield text
+        finally:
+            # Never close the process's stdin; detach leaves it usable
+            if path == STDIO_PATH:
+                text.detach()
+            else:
+                text.close()
+    finally:
+        if path != STDIO_PATH:
+            raw.close()
+
+
+@contextmanager
+def open_output_stream(path: str) -> Iterator[IO[str]]:
+    """
+    Open a summary output for writing as UTF-8 text.
+
+    ``path`` may be "-" for stdout. Outputs ending in .gz, .bz2 or .xz are
+    compressed on the fly.
+    """
+    if path == STDIO_PATH:
+        raw = sys.stdout.buffer
+        codec = None
+    else:
+        raw = open(path, 'wb', buffering=IO_BUFFER_SIZE)
+        codec = _codec_from_extension(path)
+    
+    try:
+        binary = _wrap_codec(raw, codec, 'wb')
+        if binary is not raw:
+            binary = io.BufferedWriter(binary, IO_BUFFER_SIZE)
+        text = io.TextIOWrapper(binary, encoding='utf-8')
+        try:
+            yield text
+        finally:
+            text.flush()
+            if path == STDIO_PATH:
+                text.detach()
+            else:
+                text.close()
+    finally:
+        if path != STDIO_PATH:
+            raw.close()
+
+
 class ContentType(Enum):
     """Types of content that can be extracted from slides"""
     TEXT = "text"
@@ -35,7 +167,7 @@ class ContentType(Enum):
 @dataclass
 class SlideContent:
     """Represents content from a single slide/tab"""
-    slide_number: int
+    slide_number: Optional[int]
     title: str = ""
     text: List[str] = field(default_factory=list)
     formulae: List[str] = field(default_factory=list)
@@ -53,13 +185,147 @@ class LessonSummary:
     slides: List[SlideContent] = field(default_factory=list)
 
 
+# Decoder and whitespace pattern used by the lesson offset scanner
+_SCAN_DECODER = json.JSONDecoder()
+_SCAN_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+
+def parse_slide_ranges(spec: str) -> List[Tuple[int, int]]:
+    """
+    Parse a slide selection such as "40-60", "3", "1-5,9" or "50-" into
+    inclusive ``(first, last)`` ranges. Open ends select to the first or
+    last slide.
+    """
+    ranges = []
+    for part in spec.split(','):
+        part = part.strip()
+        first, sep, last = part.partition('-')
+        try:
+            if not sep:
+                ranges.append((int(first), int(first)))
+            else:
+                ranges.append((int(first) if first.strip() else -sys.maxsize,
+                               int(last) if last.strip() else sys.maxsize))
+        except ValueError:
+            raise ValueError(f"Invalid slide range: '{part}'") from None
+        if ranges[-1][0] > ranges[-1][1]:
+            raise ValueError(f"Invalid slide range: '{part}' (start is after end)")
+    return ranges
+
+
+def normalize_slide_number(value: Any) -> Optional[int]:
+    """
+    Return a slide number from lesson JSON as an int. Integral numbers and
+    numeric strings such as "2" are accepted; anything else (null, "intro",
+    2.5, booleans) gives None.
+    """
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value
+    if isinstance(value, float):
+        return int(value) if value.is_integer() else None
+    if isinstance(value, str):
+        try:
+            return int(value.strip())
+        except ValueError:
+            return None
+    return None
+
+
+def slide_in_ranges(slide_number: int, ranges: List[Tuple[int, int]]) -> bool:
+    """Return True if ``slide_number`` falls in any of the inclusive ranges"""
+    return any(first <= slide_number <= last for first, last in ranges)
+
+
+def parse_content_types(spec: str) -> Set[str]:
+    """
+    Parse a comma-separated list of content types such as "formula,equation"
+    into a set of ``ContentType`` values.
+    """
+    valid = {content_type.value for content_type in ContentType}
+    content_types = {part.strip().lower() for part in spec.split(',') if part.strip()}
+    unknown = content_types - valid
+    if unknown or not content_types:
+        raise ValueError(
+            f"Invalid content type(s): '{spec}' (choose from {', '.join(sorted(valid))})"
+        )
+    return content_types
+
+
+def scan_lesson_text(text: str, keep: Optional[Callable[[Optional[int]], bool]] = None
+                     ) -> Tuple[Optional[str], List[Tuple[Optional[int], Dict[str, Any]]]]:
+    """
+    Scan lesson JSON slide by slide.
+    
+    Returns the lesson title and a ``(slide_number, slide_data)`` entry for
+    each slide object for which ``keep(slide_number)`` is true (every slide
+    if ``keep`` is None). ``slide_number`` is normalized by
+    ``normalize_slide_number``, so it is None for a slide without one.
+    
+    Each slide is decoded by the C JSON decoder to find where it ends, and
+    slides that aren't kept are dropped straight away. This skips building
+    and rendering SlideContent for them, but the whole text is still
+    parsed: the scan costs about as much as ``json.loads`` of the file.
+    """
+    def skip_whitespace(pos: int) -> int:
+        return _SCAN_WHITESPACE.match(text, pos).end()
+    
+    def expect(pos: int, char: str) -> int:
+        if text[pos:pos + 1] != char:
+            raise json.JSONDecodeError(f"Expecting '{char}'", text, pos)
+        return skip_whitespace(pos + 1)
+    
+    def end_of_item(pos: int, closing: str) -> Tuple[int, bool]:
+        """Step past a ',' separator, or report the container's closing char"""
+        pos = skip_whitespace(pos)
+        if text[pos:pos + 1] == closing:
+            return pos + 1, True
+        return expect(pos, ','), False
+    
+    lesson_title = None
+    slides = []
+    
+    pos = expect(skip_whitespace(0), '{')
+    done = text[pos:pos + 1] == '}'
+    while not done:
+        if text[pos:pos + 1] != '"':
+            raise json.JSONDecodeError("Expecting property name enclosed in double quotes",
+                                       text, pos)
+        key, pos = json.decoder.scanstring(text, pos + 1)
+        pos = expect(skip_whitespace(pos), ':')
+        
+        if key == 'slides' and text[pos:pos + 1] == '[':
+            pos = skip_whitespace(pos + 1)
+            slides_done = text[pos:pos + 1] == ']'
+            if slides_done:
+                pos += 1
+            while not slides_done:
+                slide_data, end = _SCAN_DECODER.raw_decode(text, pos)
+                if isinstance(slide_data, dict):
+                    slide_number = normalize_slide_number(slide_data.get('slide_number'))
+                    if keep is None or keep(slide_number):
+                        slides.append((slide_number, slide_data))
+                pos, slides_done = end_of_item(end, ']')
+        else:
+            value, pos = _SCAN_DECODER.raw_decode(text, pos)
+            if key == 'lesson_title':
+                lesson_title = value
+        
+        pos, done = end_of_item(pos, '}')
+    
+    return lesson_title, slides
+
+
 class VideoSummaryGenerator:
     """Generates structured summaries from educational video content"""
     
     def __init__(self):
         self.current_lesson = None
     
-    def load_lesson_data(self, input_file: str) -> LessonSummary:
+    def load_lesson_data(self, input_file: str,
+                         slide_ranges: Optional[List[Tuple[int, int]]] = None,
+                         content_types: Optional[Set[str]] = None) -> LessonSummary:
         """
         Load lesson data from a JSON file.
         
@@ -83,49 +349,99 @@ class VideoSummaryGenerator:
                 ...
             ]
         }
-        """
-        with open(input_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
         
-        lesson = LessonSummary(lesson_title=data.get('lesson_title', 'Untitled Lesson'))
+        ``input_file`` may be "-" for stdin, and may be gzip, bz2 or xz
+        compressed.
         
-        for slide_data in data.get('slides', []):
-            slide = SlideContent(
-                slide_number=slide_data.get('slide_number', 0),
-                title=slide_data.get('title', '')
-            )
-            
-            for item in slide_data.get('content', []):
-                content_type = item.get('type', '').lower()
-                
-                if content_type == 'text':
-                    slide.text.append(item.get('value', ''))
-                elif content_type == 'formula':
-                    slide.formulae.append(item.get('value', ''))
-                elif content_type == 'equation':
-                    slide.equations.append(item.get('value', ''))
-                elif content_type == 'table':
-                    slide.tables.append({
-                        'headers': item.get('headers', []),
-                        'rows': item.get('rows', [])
-                    })
-                elif content_type == 'key_term':
-                    slide.key_terms.append({
-                        'term': item.get('term', ''),
-                        'definition': item.get('definition', '')
-                    })
-                elif content_type == 'graph':
-                    slide.graphs.append({
-                        'description': item.get('description', ''),
-                        'image_path': item.get('image_path', '')
-                    })
-                elif content_type == 'example':
-                    slide.examples.append(item.get('value', ''))
+        ``slide_ranges`` (see ``parse_slide_ranges``) keeps only slides whose
+        number falls in one of the ranges. Numeric strings such as "2" count
+        as numbers; slides with a missing or non-numeric number are skipped.
+        
+        ``content_types`` (see ``parse_content_types``) keeps only those
+        content items, dropping slides left empty.
+        
+        When either is given, unselected slides are not
+        built or rendered. The whole file is still read and parsed (see
+        ``scan_lesson_text``), so an extract costs about one ``json.loads``
+        of the file plus the work for the selected slides.
+        """
+        if slide_ranges is None and content_types is None:
+            with open_input_stream(input_file) as f:
+                data = json.load(f)
             
+            lesson = LessonSummary(lesson_title=self._lesson_title(data.get('lesson_title')))
+            for slide_data in data.get('slides', []):
+                lesson.slides.append(self._parse_slide(slide_data))
+            return lesson
+        
+        with open_input_stream(input_file) as f:
+            text = f.read()
+        
+        def selected(slide_number: Optional[int]) -> bool:
+            # A slide without a usable number can't fall in any range
+            return slide_ranges is None or (
+                slide_number is not None and slide_in_ranges(slide_number, slide_ranges))
+        
+        # Only the selected slides are turned into SlideContent
+        lesson_title, slides = scan_lesson_text(text, keep=selected)
+        lesson = LessonSummary(lesson_title=self._lesson_title(lesson_title))
+        for _, slide_data in slides:
+            slide = self._parse_slide(slide_data, content_types)
+            if content_types is not None and not any((
+                    slide.text, slide.formulae, slide.equations, slide.tables,
+                    slide.key_terms, slide.graphs, slide.examples)):
+                continue
             lesson.slides.append(slide)
         
         return lesson
     
+    @staticmethod
+    def _lesson_title(value: Any) -> Any:
+        """Lesson title from the JSON, with a fallback if it's missing or null"""
+        return 'Untitled Lesson' if value is None else value
+    
+    def _parse_slide(self, slide_data: Dict[str, Any],
+                     content_types: Optional[Set[str]] = None) -> SlideContent:
+        """
+        Build a SlideContent from one decoded slide, keeping only content
+        items whose type is in ``content_types`` when it is given.
+        """
+        slide = SlideContent(
+            slide_number=slide_data.get('slide_number'),
+            title=slide_data.get('title', '')
+        )
+        
+        for item in slide_data.get('content', []):
+            content_type = item.get('type', '').lower()
+            if content_types is not None and content_type not in content_types:
+                continue
+            
+            if content_type == 'text':
+                slide.text.append(item.get('value', ''))
+            elif content_type == 'formula':
+                slide.formulae.append(item.get('value', ''))
+            elif content_type == 'equation':
+                slide.equations.append(item.get('value', ''))
+            elif content_type == 'table':
+                slide.tables.append({
+                    'headers': item.get('headers', []),
+                    'rows': item.get('rows', [])
+                })
+            elif content_type == 'key_term':
+                slide.key_terms.append({
+                    'term': item.get('term', ''),
+                    'definition': item.get('definition', '')
+                })
+            elif content_type == 'graph':
+                slide.graphs.append({
+                    'description': item.get('description', ''),
+                    'image_path': item.get('image_path', '')
+                })
+            elif content_type == 'example':
+                slide.examples.append(item.get('value', ''))
+        
+        return slide
+    
     def generate_markdown_summary(self, lesson: LessonSummary) -> str:
         """
         Generate a structured Markdown summary from lesson data.
@@ -164,71 +480,7 @@ class VideoSummaryGenerator:
         
         # Process each slide
         for slide in lesson.slides:
-            if slide.title:
-                # H3: Slide/Section Title
-                output.append(f"### {slide.title}\n")
-            else:
-                output.append(f"### Slide {slide.slide_number}\n")
-            
-            # Text content
-            if slide.text:
-                for text in slide.text:
-                    output.append(f"- {text}\n")
-                output.append("\n")
-            
-            # Formulae and Equations
-            if slide.formulae or slide.equations:
-                output.append("#### Formulae and Equations\n")
-                
-                if slide.formulae:
-                    for formula in slide.formulae:
-                        output.append(f"```\n{formula}\n```\n")
-                
-                if slide.equations:
-                    for equation in slide.equations:
-                        output.append(f"```\n{equation}\n```\n")
-                
-                output.append("\n")
-            
-            # Tables
-            if slide.tables:
-                output.append("#### Tables\n")
-                for table in slide.tables:
-                    headers = table.get('headers', [])
-                    rows = table.get('rows', [])
-                    
-                    if headers:
-                        # Markdown table header
-                        output.append("| " + " | ".join(headers) + " |\n")
-                        output.append("| " + " | ".join(["---"] * len(headers)) + " |\n")
-                        
-                        # Table rows
-                        for row in rows:
-                            output.append("| " + " | ".join(str(cell) for cell in row) + " |\n")
-                    
-                    output.append("\n")
-            
-            # Graphs and Visualizations
-            if slide.graphs:
-                output.append("#### Graphs and Visualizations\n")
-                for graph in slide.graphs:
-                    description = graph.get('description', '')
-                    image_path = graph.get('image_path', '')
-                    
-                    if description:
-                        output.append(f"**{description}**\n")
-                    
-                    if image_path:
-                        output.append(f"![Graph]({image_path})\n")
-                    
-                    output.append("\n")
-            
-            # Examples
-            if slide.examples:
-                output.append("#### Examples\n")
-                for idx, example in enumerate(slide.examples, 1):
-                    output.append(f"{idx}. {example}\n")
-                output.append("\n")
+            self.render_slide(slide, output)
         
         # Generate consolidated sections
         output.append("---\n\n")
@@ -258,42 +510,484 @@ class VideoSummaryGenerator:
         
         return "".join(output)
     
-    def process_lesson(self, input_file: str, output_file: str):
+    def render_slide(self, slide: SlideContent, output: List[str]):
+        """
+        Append the Markdown for a single slide (H3 section with H4 subsections)
+        to ``output``.
+        """
+        if slide.title:
+            # H3: Slide/Section Title
+            output.append(f"### {slide.title}\n")
+        else:
+            number = 0 if slide.slide_number is None else slide.slide_number
+            output.append(f"### Slide {number}\n")
+        
+        # Text content
+        if slide.text:
+            for text in slide.text:
+                output.append(f"- {text}\n")
+            output.append("\n")
+        
+        # Formulae and Equations
+        if slide.formulae or slide.equations:
+            output.append("#### Formulae and Equations\n")
+            
+            if slide.formulae:
+                for formula in slide.formulae:
+                    output.append(f"```\n{formula}\n```\n")
+            
+            if slide.equations:
+                for equation in slide.equations:
+                    output.append(f"```\n{equation}\n```\n")
+            
+            output.append("\n")
+        
+        # Tables
+        if slide.tables:
+            output.append("#### Tables\n")
+            for table in slide.tables:
+                headers = table.get('headers', [])
+                rows = table.get('rows', [])
+                
+                if headers:
+                    # Markdown table header
+                    output.append("| " + " | ".join(headers) + " |\n")
+                    output.append("| " + " | ".join(["---"] * len(headers)) + " |\n")
+                    
+                    # Table rows
+                    for row in rows:
+                        output.append("| " + " | ".join(str(cell) for cell in row) + " |\n")
+                
+                output.append("\n")
+        
+        # Graphs and Visualizations
+        if slide.graphs:
+            output.append("#### Graphs and Visualizations\n")
+            for graph in slide.graphs:
+                description = graph.get('description', '')
+                image_path = graph.get('image_path', '')
+                
+                if description:
+                    output.append(f"**{description}**\n")
+                
+                if image_path:
+                    output.append(f"![Graph]({image_path})\n")
+                
+                output.append("\n")
+        
+        # Examples
+        if slide.examples:
+            output.append("#### Examples\n")
+            for idx, example in enumerate(slide.examples, 1):
+                output.append(f"{idx}. {example}\n")
+            output.append("\n")
+    
+    def process_lesson(self, input_file: str, output_file: str,
+                       slide_ranges: Optional[List[Tuple[int, int]]] = None,
+                       content_types: Optional[Set[str]] = None):
         """
         Main processing function to load lesson data and generate summary.
+        
+        Either path may be "-" for stdin/stdout; status messages then go to
+        stderr so they don't mix with the summary in a pipeline.
+        ``slide_ranges`` and ``content_types`` select an extract of the
+        lesson as in ``load_lesson_data``.
         """
-        lesson = self.load_lesson_data(input_file)
+        lesson = self.load_lesson_data(input_file, slide_ranges, content_types)
         summary = self.generate_markdown_summary(lesson)
         
-        with open(output_file, 'w', encoding='utf-8') as f:
+        with open_output_stream(output_file) as f:
             f.write(summary)
         
-        print(f"Summary generated successfully!")
-        print(f"Input: {input_file}")
-        print(f"Output: {output_file}")
-        print(f"Total slides processed: {len(lesson.slides)}")
+        status = sys.stderr if output_file == STDIO_PATH else sys.stdout
+        print(f"Summary generated successfully!", file=status)
+        print(f"Input: {input_file}", file=status)
+        print(f"Output: {output_file}", file=status)
+        print(f"Total slides processed: {len(lesson.slides)}", file=status)
+
+
+class CourseBookBuilder:
+    """
+    Builds a single course "book" from an ordered manifest of lessons.
+    
+    Each lesson is loaded, rendered and dropped in turn, so only one
+    ``LessonSummary`` is ever held in memory. Rendered bodies and sorted
+    runs of key terms and formulae are kept in a cache directory keyed by
+    a digest of the lesson file, which lets unchanged lessons be reused by
+    the next build and lets the glossary and formula index be produced by
+    a streaming k-way merge over the per-lesson runs.
+    """
+    
+    # File suffixes of a cached lesson fragment
+    BODY_SUFFIX = '.body.md'
+    TERMS_SUFFIX = '.terms.jsonl'
+    FORMULAE_SUFFIX = '.formulae.jsonl'
+    META_SUFFIX = '.meta.json'
+    
+    # Names of cached fragment files: a SHA-256 hex digest and a suffix
+    FRAGMENT_NAME = re.compile(
+        r'^[0-9a-f]{64}(?:\.body\.md|\.terms\.jsonl|\.formulae\.jsonl|\.meta\.json)$'
+    )
+    
+    def __init__(self, generator: Optional[VideoSummaryGenerator] = None,
+                 cache_dir: Optional[str] = None, prune_cache: bool = False):
+        """
+        ``cache_dir`` defaults to "<output>.cache", which the builder owns
+        and prunes after every build. A ``cache_dir`` given explicitly may be
+        shared with other courses, so it is only pruned if ``prune_cache``.
+        """
+        self.generator = generator or VideoSummaryGenerator()
+        self.cache_dir = cache_dir
+        self.prune_cache = prune_cache
+        self._tool_source_digest = None
+    
+    def load_manifest(self, manifest_file: str) -> Tuple[str, List[str]]:
+        """
+        Load a course manifest and return its title and lesson paths.
+        
+        Expected format:
+        {
+            "course_title": "Course Title",
+            "lessons": ["lesson_01.json", "lesson_02.json.gz", ...]
+        }
+        
+        Relative lesson paths are resolved against the manifest's directory.
+        """
+        with open_input_stream(manifest_file) as f:
+            data = json.load(f)
+        
+        base_dir = '' if manifest_file == STDIO_PATH else os.path.dirname(manifest_file)
+        lessons = [os.path.join(base_dir, path) for path in data.get('lessons', [])]
+        return data.get('course_title', 'Untitled Course'), lessons
+    
+    def build(self, manifest_file: str, output_file: str) -> Dict[str, int]:
+        """
+        Build the course book for ``manifest_file`` into ``output_file``.
+        
+        Returns counts of the lessons processed and reused from the cache.
+        """
+        course_title, lesson_files = self.load_manifest(manifest_file)
+        
+        cache_dir = self.cache_dir
+        prune = self.prune_cache
+        if cache_dir is None and output_file != STDIO_PATH:
+            cache_dir = output_file + '.cache'
+            prune = True
+        
+        if cache_dir is None:
+            import tempfile
+            with tempfile.TemporaryDirectory() as temp_dir:
+                stats = self._build(course_title, lesson_files, temp_dir, output_file)
+        else:
+            os.makedirs(cache_dir, exist_ok=True)
+            stats = self._build(course_title, lesson_files, cache_dir, output_file)
+            if prune:
+                self._prune_cache(cache_dir, stats['digests'])
+        
+        del stats['digests']
+        return stats
+    
+    def _build(self, course_title: str, lesson_files: List[str],
+               cache_dir: str, output_file: str) -> Dict[str, Any]:
+        """Render (or reuse) every lesson fragment, then assemble the book"""
+        fragments = []
+        reused = 0
+        # Fragments rendered by this build; a repeated lesson hitting one of
+        # them is not a reuse from a previous build
+        rendered = set()
+        for lesson_file in lesson_files:
+            fragment, was_cached = self._lesson_fragment(lesson_file, cache_dir)
+            fragments.append(fragment)
+            if not was_cached:
+                rendered.add(fragment['digest'])
+            elif fragment['digest'] not in rendered:
+                reused += 1
+        
+        with open_output_stream(output_file) as out:
+            self._write_book(out, course_title, fragments, cache_dir)
+        
+        return {
+            'lessons': len(fragments),
+            'reused': reused,
+            'digests': {fragment['digest'] for fragment in fragments},
+        }
+    
+    def _tool_digest(self) -> str:
+        """
+        Digest of this module's source, so a changed tool never reuses
+        fragments rendered by an older one.
+        """
+        if self._tool_source_digest is None:
+            import hashlib
+            try:
+                # The loader also reads the source from inside a zipapp
+                source = __loader__.get_data(__file__)
+            except (NameError, AttributeError, OSError):
+                source = b''
+            self._tool_source_digest = hashlib.sha256(source).hexdigest()
+        return self._tool_source_digest
+    
+    def _lesson_digest(self, lesson_file: str) -> str:
+        """Digest identifying a lesson file's contents and the tool version"""
+        import hashlib
+        digest = hashlib.sha256(
+            f"v{COURSE_CACHE_VERSION}:{self._tool_digest()}:".encode('ascii'))
+        with open(lesson_file, 'rb') as f:
+            for chunk in iter(lambda: f.read(IO_BUFFER_SIZE), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+    
+    def _lesson_fragment(self, lesson_file: str, cache_dir: str) -> Tuple[Dict[str, Any], bool]:
+        """
+        Return the cached fragment metadata for a lesson, rendering and
+        caching it first if the lesson has changed since the last build.
+        """
+        digest = self._lesson_digest(lesson_file)
+        prefix = os.path.join(cache_dir, digest)
+        meta_path = prefix + self.META_SUFFIX
+        
+        if os.path.exists(meta_path):
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                return json.load(f), True
+        
+        lesson = self.generator.load_lesson_data(lesson_file)
+        
+        output = []
+        for slide in lesson.slides:
+            self.generator.render_slide(slide, output)
+        
+        terms = []
+        formulae = []
+        for slide in lesson.slides:
+            slide_number = self._slide_label(slide.slide_number)
+            for term_dict in slide.key_terms:
+                term = term_dict.get('term', '')
+                terms.append([term.strip().casefold(), term, term_dict.get('definition', ''),
+                              slide_number])
+            for formula in slide.formulae + slide.equations:
+                formulae.append([formula.strip(), formula, '', slide_number])
+        
+        self._write_atomic(prefix + self.BODY_SUFFIX, "".join(output))
+        self._write_atomic(prefix + self.TERMS_SUFFIX, self._dump_run(terms))
+        self._write_atomic(prefix + self.FORMULAE_SUFFIX, self._dump_run(formulae))
+        
+        fragment = {
+            'digest': digest,
+            'lesson_title': lesson.lesson_title,
+            'slides': len(lesson.slides),
+        }
+        # The metadata file is written last: its presence marks a complete entry
+        self._write_atomic(meta_path, json.dumps(fragment))
+        return fragment, False
+    
+    @staticmethod
+    def _slide_label(slide_number: Any) -> Any:
+        """
+        Slide number as stored in index runs: an int where it normalizes to
+        one, otherwise its text, or None if the slide has no number.
+        """
+        number = normalize_slide_number(slide_number)
+        if number is not None:
+            return number
+        return None if slide_number is None else str(slide_number)
+    
+    @staticmethod
+    def _slide_sort_key(slide_label: Any) -> Tuple[int, Any]:
+        """Sort key ordering numbered slides first, then text labels"""
+        if isinstance(slide_label, int):
+            return (0, slide_label)
+        return (1, '' if slide_label is None else slide_label)
+    
+    def _dump_run(self, entries: List[List[Any]]) -> str:
+        """Serialize index entries as a sorted JSON Lines run"""
+        entries.sort(key=lambda entry: (entry[0], self._slide_sort_key(entry[3])))
+        return "".join(json.dumps(entry, ensure_ascii=False) + "\n" for entry in entries)
+    
+    @staticmethod
+    def _write_atomic(path: str, text: str):
+        """Write ``text`` to ``path`` so readers never see a partial file"""
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(temp_path, path)
+    
+    def _write_book(self, out: IO[str], course_title: str,
+                    fragments: List[Dict[str, Any]], cache_dir: str):
+        """Stream the book: contents, lesson bodies, glossary, formula index"""
+        import shutil
+        
+        # H1: Course Title
+        out.write(f"# {course_title}\n")
+        
+        out.write("## Contents\n")
+        for number, fragment in enumerate(fragments, 1):
+            out.write(f"{number}. [{fragment['lesson_title']}](#lesson-{number})\n")
+        out.write("\n")
+        
+        # H2 per lesson, followed by its cached H3 slide sections
+        for number, fragment in enumerate(fragments, 1):
+            out.write(f'<a id="lesson-{number}"></a>\n')
+            out.write(f"## {number}. {fragment['lesson_title']}\n")
+            body_path = os.path.join(cache_dir, fragment['digest'] + self.BODY_SUFFIX)
+            with open(body_path, 'r', encoding='utf-8') as f:
+                shutil.copyfileobj(f, out, IO_BUFFER_SIZE)
+        
+        out.write("---\n\n")
+        
+        glossary = self._merge_runs(fragments, cache_dir, self.TERMS_SUFFIX)
+        first = True
+        for _, group in itertools.groupby(glossary, key=lambda entry: entry[0]):
+            group = list(group)
+            if first:
+                out.write("## Glossary\n")
+                first = False
+            
+            # Lessons may define the same term differently; keep every
+            # distinct definition, in order of first appearance
+            definitions = {}
+            for entry in group:
+                definitions.setdefault(entry[3], []).append(entry)
+            
+            term = group[0][2]
+            if len(definitions) == 1:
+                out.write(f"**{term}**: {group[0][3]} ({self._references(group)})\n")
+            else:
+                out.write(f"**{term}**:\n")
+                for definition, entries in definitions.items():
+                    out.write(f"- {definition} ({self._references(entries)})\n")
+        if not first:
+            out.write("\n")
+        
+        formula_index = self._merge_runs(fragments, cache_dir, self.FORMULAE_SUFFIX)
+        first = True
+        for _, group in itertools.groupby(formula_index, key=lambda entry: entry[0]):
+            group = list(group)
+            if first:
+                out.write("## Formula Index\n")
+                first = False
+            out.write(f"- `{group[0][2]}` ({self._references(group)})\n")
+        if not first:
+            out.write("\n")
+    
+    def _merge_runs(self, fragments: List[Dict[str, Any]], cache_dir: str,
+                    suffix: str) -> Iterator[List[Any]]:
+        """
+        Merge the sorted per-lesson runs with ``suffix`` into one sorted
+        stream of ``[key, lesson_number, value, detail, slide_number]``.
+        """
+        def read_run(number: int, digest: str) -> Iterator[List[Any]]:
+            with open(os.path.join(cache_dir, digest + suffix), 'r', encoding='utf-8') as f:
+                for line in f:
+                    key, value, detail, slide_number = json.loads(line)
+                    yield [key, number, value, detail, slide_number]
+        
+        import heapq
+        runs = [read_run(number, fragment['digest'])
+                for number, fragment in enumerate(fragments, 1)]
+        return heapq.merge(*runs, key=lambda entry: (
+            entry[0], entry[1], self._slide_sort_key(entry[4])))
+    
+    def _references(self, group: List[List[Any]]) -> str:
+        """Format cross-lesson references for a group of merged index entries"""
+        references = []
+        for number, entries in itertools.groupby(group, key=lambda entry: entry[1]):
+            reference = f"[Lesson {number}](#lesson-{number})"
+            labels = {entry[4] for entry in entries if entry[4] is not None}
+            if labels:
+                slides = [str(label) for label in sorted(labels, key=self._slide_sort_key)]
+                label = "slide" if len(slides) == 1 else "slides"
+                reference += f", {label} {', '.join(slides)}"
+            references.append(reference)
+        return "; ".join(references)
+    
+    def _prune_cache(self, cache_dir: str, digests: Set[str]):
+        """Remove cached fragments that the current build no longer uses"""
+        for name in os.listdir(cache_dir):
+            # Leave alone anything that isn't one of our fragment files
+            if self.FRAGMENT_NAME.match(name) and name[:64] not in digests:
+                os.remove(os.path.join(cache_dir, name))
+    
+    def process_course(self, manifest_file: str, output_file: str):
+        """
+        Main processing function to build a course book from a manifest.
+        """
+        stats = self.build(manifest_file, output_file)
+        
+        status = sys.stderr if output_file == STDIO_PATH else sys.stdout
+        print(f"Course book generated successfully!", file=status)
+        print(f"Manifest: {manifest_file}", file=status)
+        print(f"Output: {output_file}", file=status)
+        print(f"Lessons processed: {stats['lessons']} ({stats['reused']} reused from cache)",
+              file=status)
+
+
+def _cli_type(parse):
+    """Adapt a ValueError-raising parser into an argparse ``type``"""
+    def convert(value: str):
+        try:
+            return parse(value)
+        except ValueError as exc:
+            import argparse
+            raise argparse.ArgumentTypeError(str(exc)) from None
+    return convert
 
 
 def main():
     """Command-line interface for the video summary tool"""
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="Educational Video Summary Tool - Generate structured summaries from educational content"
     )
-    parser.add_argument(
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument(
         '--input', '-i',
-        required=True,
-        help="Input JSON file containing lesson data"
+        help="Input JSON file containing lesson data (.gz/.bz2/.xz accepted, '-' for stdin)"
+    )
+    source.add_argument(
+        '--course', '-c',
+        help="Course manifest JSON listing lesson files in order; builds a single course book"
     )
     parser.add_argument(
         '--output', '-o',
         required=True,
-        help="Output Markdown file for the summary"
+        help="Output Markdown file for the summary (.gz/.bz2/.xz compressed by extension, '-' for stdout)"
+    )
+    
+    parser.add_argument(
+        '--slides',
+        type=_cli_type(parse_slide_ranges),
+        help="Only summarize these slide numbers, e.g. '40-60', '1-5,9' or '50-'"
+    )
+    parser.add_argument(
+        '--types',
+        type=_cli_type(parse_content_types),
+        help="Only include these content types, e.g. 'formula,equation' or 'table'"
+    )
+    parser.add_argument(
+        '--cache-dir',
+        help="Directory for reusable lesson fragments in course mode (default: <output>.cache)"
+    )
+    parser.add_argument(
+        '--prune-cache',
+        action='store_true',
+        help="Remove fragments of lessons not in this course from --cache-dir "
+             "(the default cache is always pruned)"
     )
     
     args = parser.parse_args()
     
-    generator = VideoSummaryGenerator()
-    generator.process_lesson(args.input, args.output)
+    if args.course and (args.slides or args.types):
+        parser.error("--slides and --types cannot be used with --course")
+    if args.input and (args.cache_dir or args.prune_cache):
+        parser.error("--cache-dir and --prune-cache can only be used with --course")
+    
+    if args.course:
+        builder = CourseBookBuilder(cache_dir=args.cache_dir, prune_cache=args.prune_cache)
+        builder.process_course(args.course, args.output)
+    else:
+        generator = VideoSummaryGenerator()
+        generator.process_lesson(args.input, args.output, args.slides, args.types)
 
 
 if __name__ == "__main__":